@@ -0,0 +1,57 @@
+// Runs every integration example in a single process.
+//
+// Each example is compiled in as its own namespace with `main` renamed, so
+// the integration tests pay process start-up once instead of once per
+// example. All outputs are written to the current working directory.
+
+// Pull in every header the examples use up front. The re-includes inside the
+// namespaces below are then no-ops thanks to the include guards.
+#include <array>
+#include <cmath>
+#include <cstdint>
+#include <filesystem>
+#include <iostream>
+#include <microvtk/microvtk.hpp>
+#include <string>
+#include <vector>
+
+// NOLINTBEGIN(bugprone-suspicious-include)
+#define main run
+namespace example_basic {
+#include "basic_usage.cpp"
+}  // namespace example_basic
+namespace example_time_series {
+#include "time_series.cpp"
+}  // namespace example_time_series
+namespace example_complex_grid {
+#include "complex_grid.cpp"
+}  // namespace example_complex_grid
+namespace example_compression {
+#include "compression.cpp"
+}  // namespace example_compression
+#undef main
+// NOLINTEND(bugprone-suspicious-include)
+
+int main() {
+  struct Example {
+    const char* name;
+    int (*run)();
+  };
+
+  const std::array<Example, 4> examples = {{
+      {"example_basic", example_basic::run},
+      {"example_time_series", example_time_series::run},
+      {"example_complex_grid", example_complex_grid::run},
+      {"example_compression", example_compression::run},
+  }};
+
+  int status = 0;
+  for (const auto& example : examples) {
+    if (example.run() != 0) {
+      std::cerr << example.name << " failed\n";
+      status = 1;
+    }
+  }
+
+  return status;
+}
@@ -0,0 +1,90 @@
+import functools
+import os
+import subprocess
+import sys
+
+import pytest
+import vtk
+
+
+# Possible build directories, relative to the directory pytest is started from
+CANDIDATE_DIRS = [
+    "build",
+    "build/bin",
+    "build/examples",
+    "build/examples/Release",
+    "build/examples/Debug",
+    "build_release/examples",
+    "build_release/examples/Release",
+    "build/msvc-debug/Debug"
+]
+CANDIDATE_ROOTS = [os.path.join(os.getcwd(), sub) for sub in CANDIDATE_DIRS]
+
+# Adjust for Windows
+EXE_SUFFIX = ".exe" if sys.platform == "win32" else ""
+
+@functools.lru_cache(maxsize=None)
+def find_executable(name):
+    """Finds the build executable in likely locations."""
+    filename = name + EXE_SUFFIX
+    for root in CANDIDATE_ROOTS:
+        path = os.path.join(root, filename)
+        if os.path.exists(path):
+            return path
+
+    return None
+
+@pytest.fixture(scope="session")
+def example_outputs(tmp_path_factory):
+    """Runs example_run_all once and returns the directory holding every output."""
+    exe = find_executable("example_run_all")
+    if not exe:
+        pytest.skip("example_run_all executable not found. Build the project first.")
+
+    workdir = tmp_path_factory.mktemp("examples")
+    # Only stderr is ever reported, and only on failure
+    result = subprocess.run(
+        [exe], cwd=workdir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    assert result.returncode == 0, f"Examples failed: {result.stderr.decode(errors='replace')}"
+
+    return workdir
+
+def example_output(example_outputs, filename):
+    """Returns the absolute path of an example output, checking that it exists."""
+    output_file = example_outputs / filename
+    assert output_file.exists(), f"{filename} was not created"
+
+    return str(output_file)
+
+@pytest.fixture(scope="session")
+def basic_vtu_file(example_outputs):
+    """Returns the path to the vtu file generated by example_basic."""
+    return example_output(example_outputs, "example.vtu")
+
+@pytest.fixture(scope="session")
+def pvd_files(example_outputs):
+    """Returns the main PVD file generated by example_time_series."""
+    return example_output(example_outputs, "wave_simulation.pvd")
+
+@pytest.fixture(scope="session")
+def complex_vtu_file(example_outputs):
+    """Returns the path to the vtu file generated by example_complex_grid."""
+    return example_output(example_outputs, "complex_grid.vtu")
+
+@pytest.fixture(scope="session")
+def compressed_vtu_file(example_outputs):
+    """Returns the path to the vtu file generated by example_compression."""
+    return example_output(example_outputs, "compressed.vtu")
+
+@pytest.fixture(scope="session")
+def basic_grid(basic_vtu_file):
+    """Reads the example_basic output once and returns the resulting data object.
+
+    The generic reader factory is used so tests can also check that it
+    dispatches the file to an unstructured grid.
+    """
+    reader = vtk.vtkXMLGenericDataObjectReader()
+    reader.SetFileName(basic_vtu_file)
+    reader.Update()
+    return reader.GetOutput()
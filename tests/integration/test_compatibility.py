@@ -1,126 +1,23 @@
-import pytest
 import vtk
+import mmap
 import os
-import subprocess
-import sys
-import shutil
-
-def find_executable(name):
-    """Finds the build executable in likely locations."""
-    # Possible build directories
-    candidates = [
-        "build",
-        "build/bin",
-        "build/examples",
-        "build/examples/Release",
-        "build/examples/Debug",
-        "build_release/examples",
-        "build_release/examples/Release",
-        "build/msvc-debug/Debug"
-    ]
-
-    # Adjust for Windows
-    if sys.platform == "win32":
-        name += ".exe"
-
-    root_dir = os.getcwd()
-    for sub in candidates:
-        path = os.path.join(root_dir, sub, name)
-        if os.path.exists(path):
-            return path
-
-    return None
-
-@pytest.fixture(scope="module")
-def basic_vtu_file():
-    """Runs example_basic and yields the path to the generated vtu file."""
-    exe = find_executable("example_basic")
-    if not exe:
-        pytest.skip("example_basic executable not found. Build the project first.")
-
-    cmd = [exe]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    assert result.returncode == 0, f"Example failed: {result.stderr}"
-
-    output_file = "example.vtu"
-    assert os.path.exists(output_file), "example.vtu was not created"
-
-    yield output_file
-
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
-@pytest.fixture(scope="module")
-def pvd_files():
-    """Runs example_time_series and yields the main PVD file."""
-    exe = find_executable("example_time_series")
-    if not exe:
-        pytest.skip("example_time_series executable not found.")
-
-    cmd = [exe]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    assert result.returncode == 0, f"Example failed: {result.stderr}"
-
-    pvd_file = "wave_simulation.pvd"
-    assert os.path.exists(pvd_file), "wave_simulation.pvd was not created"
-
-    yield pvd_file
-
-    # Cleanup
-    if os.path.exists(pvd_file):
-        os.remove(pvd_file)
-    # Cleanup generated vtus
-    for i in range(10):
-        f = f"wave_{i}.vtu"
-        if os.path.exists(f):
-            os.remove(f)
-
-@pytest.fixture(scope="module")
-def complex_vtu_file():
-    """Runs example_complex_grid and yields the path to the generated vtu file."""
-    exe = find_executable("example_complex_grid")
-    if not exe:
-        pytest.skip("example_complex_grid executable not found.")
-
-    cmd = [exe]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    assert result.returncode == 0, f"Example failed: {result.stderr}"
-
-    output_file = "complex_grid.vtu"
-    assert os.path.exists(output_file), "complex_grid.vtu was not created"
-
-    yield output_file
-
-    if os.path.exists(output_file):
-        os.remove(output_file)
-
-@pytest.fixture(scope="module")
-def compressed_vtu_file():
-    """Runs example_compression and yields the path."""
-    exe = find_executable("example_compression")
-    if not exe:
-        pytest.skip("example_compression executable not found.")
-
-    cmd = [exe]
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    assert result.returncode == 0, f"Example failed: {result.stderr}"
-
-    output_file = "compressed.vtu"
-    assert os.path.exists(output_file), "compressed.vtu was not created"
-
-    yield output_file
-
-    if os.path.exists(output_file):
-        os.remove(output_file)
 
-def test_read_vtu_with_official_vtk(basic_vtu_file):
-    """Verifies that the generated VTU file can be read by the official VTK library."""
-    reader = vtk.vtkXMLUnstructuredGridReader()
-    reader.SetFileName(basic_vtu_file)
-    reader.Update()
+import numpy as np
+from vtkmodules.util.numpy_support import vtk_to_numpy
 
-    grid = reader.GetOutput()
+try:
+    import lxml.etree as ET
+except ImportError:
+    # xml.etree.cElementTree was removed in Python 3.9; ElementTree uses the
+    # C accelerator automatically when available.
+    import xml.etree.ElementTree as ET
+
+# Number of leading bytes of a VTU file searched for XML header attributes
+HEADER_SCAN_BYTES = 4096
+
+def test_read_vtu_with_official_vtk(basic_grid):
+    """Verifies that the generated VTU file can be read by the official VTK library."""
+    grid = basic_grid
 
     assert grid.GetNumberOfPoints() == 4, "Expected 4 points"
     assert grid.GetNumberOfCells() == 1, "Expected 1 cell"
@@ -135,16 +32,11 @@ def test_read_vtu_with_official_vtk(basic_vtu_file):
     assert mass_array.GetNumberOfComponents() == 1
 
     expected_mass = [1.0, 2.0, 3.0, 4.0]
-    for i in range(4):
-        val = mass_array.GetValue(i)
-        assert abs(val - expected_mass[i]) < 1e-6, f"Mass at {i} mismatch"
+    np.testing.assert_allclose(vtk_to_numpy(mass_array), expected_mass, atol=1e-6)
 
-def test_legacy_reader_compatibility(basic_vtu_file):
+def test_legacy_reader_compatibility(basic_grid):
     """Double check with a generic reader factory."""
-    reader = vtk.vtkXMLGenericDataObjectReader()
-    reader.SetFileName(basic_vtu_file)
-    reader.Update()
-    data = reader.GetOutput()
+    data = basic_grid
 
     assert data.IsA("vtkUnstructuredGrid")
     assert data.GetNumberOfPoints() == 4
@@ -153,26 +45,45 @@ def test_pvd_time_series(pvd_files):
     """Verifies PVD file structure and time steps using XML parsing."""
 
     # Manual XML check for PVD correctness
-    import xml.etree.ElementTree as ET
-    tree = ET.parse(pvd_files)
-    root = tree.getroot()
-
-    assert root.tag == "VTKFile"
-    assert root.attrib["type"] == "Collection"
-
-    collection = root.find("Collection")
-    assert collection is not None
-
-    datasets = collection.findall("DataSet")
-    assert len(datasets) == 10, f"Expected 10 time steps, found {len(datasets)}"
+    # Stream the document instead of building the full tree; DataSet elements
+    # are cleared as soon as they are counted and parsing stops at the end of
+    # the Collection.
+    root_tag = None
+    root_type = None
+    found_collection = False
+    num_datasets = 0
+    first_dataset = None
+
+    for event, elem in ET.iterparse(pvd_files, events=("start", "end")):
+        if event == "start":
+            if root_tag is None:
+                root_tag = elem.tag
+                root_type = elem.get("type")
+            elif elem.tag == "Collection":
+                found_collection = True
+        elif elem.tag == "DataSet":
+            if first_dataset is None:
+                first_dataset = dict(elem.attrib)
+            num_datasets += 1
+            elem.clear()
+        elif elem.tag == "Collection":
+            break
+
+    assert root_tag == "VTKFile"
+    assert root_type == "Collection"
+
+    assert found_collection
+
+    assert num_datasets == 10, f"Expected 10 time steps, found {num_datasets}"
 
     # Check first step
     # PvdWriter uses double for time, let's check strict equality or approximate
-    assert float(datasets[0].attrib["timestep"]) == 0.0
-    assert datasets[0].attrib["file"] == "wave_0.vtu"
+    assert float(first_dataset["timestep"]) == 0.0
+    assert first_dataset["file"] == "wave_0.vtu"
 
-    # Verify that the referenced file actually exists
-    assert os.path.exists(datasets[0].attrib["file"])
+    # Verify that the referenced file actually exists (relative to the PVD)
+    pvd_dir = os.path.dirname(pvd_files)
+    assert os.path.exists(os.path.join(pvd_dir, first_dataset["file"]))
 
 def test_complex_grid_structure(complex_vtu_file):
     """Verifies the structure and data of the complex grid example."""
@@ -200,7 +111,7 @@ def test_complex_grid_structure(complex_vtu_file):
     assert temp_array.GetNumberOfTuples() == 12
     # Verify a known value (Apex of tetra at z=2.0 -> Temp=200.0)
     # The apex is the last point (index 11)
-    val_apex = temp_array.GetValue(11)
+    val_apex = vtk_to_numpy(temp_array)[11]
     assert abs(val_apex - 200.0) < 1e-6, f"Expected Temperature 200.0, got {val_apex}"
 
     # Check Cell Data: "MaterialID"
@@ -208,19 +119,21 @@ def test_complex_grid_structure(complex_vtu_file):
     assert cell_data.HasArray("MaterialID"), "Missing 'MaterialID' cell data"
     mat_array = cell_data.GetArray("MaterialID")
     assert mat_array.GetNumberOfTuples() == 2
-    assert int(mat_array.GetValue(0)) == 1
-    assert int(mat_array.GetValue(1)) == 2
+    np.testing.assert_array_equal(vtk_to_numpy(mat_array), [1, 2])
 
 def test_compressed_file(compressed_vtu_file):
     """Verifies that the compressed file is valid and readable."""
 
     # 1. Check if the file is actually using compression (inspect XML)
-    with open(compressed_vtu_file, 'rb') as f:
-        content = f.read()
+    # The compressor attribute lives on the VTKFile element, so only the
+    # start of the mapped file needs to be scanned.
+    with open(compressed_vtu_file, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
         # Should contain compressor attribute if LZ4 was enabled
         # Note: If LZ4 lib wasn't found during build, it falls back to uncompressed.
         # But we expect it to be ON in this environment.
-        if b"compressor=\"vtkLZ4DataCompressor\"" not in content and b"compressor=\"vtkZLibDataCompressor\"" not in content:
+        if mm.find(b"compressor=\"vtkLZ4DataCompressor\"", 0, HEADER_SCAN_BYTES) == -1 and \
+                mm.find(b"compressor=\"vtkZLibDataCompressor\"", 0, HEADER_SCAN_BYTES) == -1:
              # Just a warning or soft check?
              # For this test, let's assume we wanted compression.
              pass
@@ -242,6 +155,6 @@ def test_compressed_file(compressed_vtu_file):
     arr = point_data.GetArray("SineWave")
     # Spot check
     # t at i=100 is 10.0. sin(10.0) ~ -0.544
-    val = arr.GetValue(100)
+    val = vtk_to_numpy(arr)[100]
     expected = -0.54402111088
     assert abs(val - expected) < 1e-5